@@ -1,17 +1,24 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 import platform
 import threading
-from typing import Awaitable, Dict, Iterator, Optional, Tuple, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Awaitable, Dict, Iterator, Optional, Tuple, Type
 
 import scrapy
-from playwright.async_api import Error, Page, Request, Response
+from scrapy.http import Response as ScrapyResponse
 from scrapy.http.headers import Headers
+from scrapy.responsetypes import responsetypes
 from scrapy.settings import Settings
 from scrapy.utils.python import to_unicode
 from twisted.internet.defer import Deferred
 from w3lib.encoding import html_body_declared_encoding, http_content_type_encoding
 
+if TYPE_CHECKING:
+    from playwright.async_api import Error, Page
+
 
 logger = logging.getLogger("scrapy-camoufox")
 
@@ -40,6 +47,23 @@ def _encode_body(headers: Headers, text: str) -> Tuple[bytes, str]:
     return text.encode("utf-8"), "utf-8"  # fallback
 
 
+@lru_cache(maxsize=64)
+def _response_class_from_content_type(content_type: bytes) -> Type[ScrapyResponse]:
+    return responsetypes.from_content_type(content_type)
+
+
+def _get_response_class(headers: Headers, url: str, body: bytes) -> Type[ScrapyResponse]:
+    """Equivalent to responsetypes.from_args, with the Content-Type lookup cached.
+    Falls back to from_args if the Content-Type header does not determine the class.
+    """
+    content_type = headers.get(b"Content-Type")
+    if content_type:
+        respcls = _response_class_from_content_type(content_type)
+        if respcls is not ScrapyResponse:
+            return respcls
+    return responsetypes.from_args(headers=headers, url=url, body=body)
+
+
 def _is_safe_close_error(error: Error) -> bool:
     """
     Taken almost verbatim from
@@ -68,8 +92,11 @@ async def _get_page_content(
     """
     try:
         return await page.content()
-    except Error as err:
-        if _NAVIGATION_ERROR_MSG in err.message:
+    except Exception as err:
+        # Playwright is imported lazily, it has already been loaded at this point
+        from playwright.async_api import Error
+
+        if isinstance(err, Error) and _NAVIGATION_ERROR_MSG in err.message:
             logger.debug(
                 "Retrying to get content from page '%s', error: '%s'",
                 page.url,
@@ -93,16 +120,6 @@ def _get_float_setting(settings: Settings, key: str) -> Optional[float]:
         return None
 
 
-async def _get_header_value(
-    resource: Union[Request, Response],
-    header_name: str,
-) -> Optional[str]:
-    try:
-        return await resource.header_value(header_name)
-    except Exception:
-        return None
-
-
 class _ThreadedLoopAdapter:
     """Utility class to start an asyncio event loop in a new thread and redirect coroutines.
     This allows to run Playwright in a different loop than the Scrapy crawler, allowing to
@@ -1,26 +1,30 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 import platform
+import sys
+from collections import Counter
 from contextlib import suppress
 from dataclasses import dataclass, field as dataclass_field
-from functools import partial
+from functools import lru_cache, partial
 from ipaddress import ip_address
+from pathlib import Path
 from time import time
-from typing import Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
-
-from camoufox.async_api import AsyncNewBrowser
-from playwright._impl._errors import TargetClosedError
-from playwright.async_api import (
-    BrowserContext,
-    Download as PlaywrightDownload,
-    Error as PlaywrightError,
-    Page,
-    Playwright as AsyncPlaywright,
-    PlaywrightContextManager,
-    Request as PlaywrightRequest,
-    Response as PlaywrightResponse,
-    Route,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
 )
+
 from scrapy import Spider, signals
 from scrapy.core.downloader.handlers.http import HTTPDownloadHandler
 from scrapy.crawler import Crawler
@@ -38,12 +42,28 @@ from scrapy_camoufox._utils import (
     _ThreadedLoopAdapter,
     _encode_body,
     _get_float_setting,
-    _get_header_value,
     _get_page_content,
+    _get_response_class,
     _is_safe_close_error,
     _maybe_await,
 )
 
+if TYPE_CHECKING:
+    from camoufox.async_api import AsyncNewBrowser
+    from playwright._impl._errors import TargetClosedError
+    from playwright.async_api import (
+        Browser,
+        BrowserContext,
+        Download as PlaywrightDownload,
+        Error as PlaywrightError,
+        Page,
+        Playwright as AsyncPlaywright,
+        PlaywrightContextManager,
+        Request as PlaywrightRequest,
+        Response as PlaywrightResponse,
+        Route,
+    )
+
 
 __all__ = ["ScrapyCamoufoxDownloadHandler"]
 
@@ -57,6 +77,77 @@ logger = logging.getLogger("scrapy-camoufox")
 DEFAULT_BROWSER_TYPE = "firefox"
 DEFAULT_CONTEXT_NAME = "default"
 PERSISTENT_CONTEXT_PATH_KEY = "user_data_dir"
+MAX_USES_PER_PAGE = 100
+STARTUP_CONCURRENCY = 4
+STATS_FLUSH_INTERVAL = 1.0
+# below this size (in characters), encoding in a thread costs more than it saves
+ENCODE_BODY_THREAD_THRESHOLD = 256 * 1024
+
+_REQUEST_STATS_PREFIX = "camoufox/request_count"
+_RESPONSE_STATS_PREFIX = "camoufox/response_count"
+_RESOURCE_TYPES = (
+    "document",
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+)
+_HTTP_METHODS = ("GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH")
+
+
+_LAZY_IMPORTED = False
+
+
+def _lazy_import() -> None:
+    """Import the Playwright and Camoufox objects used at runtime. Deferred until
+    a download handler is created, to keep importing this module cheap.
+    """
+    global _LAZY_IMPORTED
+    global AsyncNewBrowser, TargetClosedError, PlaywrightError, Page
+    global PlaywrightContextManager, PlaywrightResponse
+    if _LAZY_IMPORTED:
+        return
+    from camoufox.async_api import AsyncNewBrowser
+    from playwright._impl._errors import TargetClosedError
+    from playwright.async_api import (
+        Error as PlaywrightError,
+        Page,
+        PlaywrightContextManager,
+        Response as PlaywrightResponse,
+    )
+
+    _LAZY_IMPORTED = True
+
+
+def _make_stats_keys(prefix: str, values: Tuple[str, ...]) -> Dict[str, str]:
+    return {value: sys.intern(f"{prefix}/{value}") for value in values}
+
+
+_REQUEST_RESOURCE_TYPE_PREFIX = f"{_REQUEST_STATS_PREFIX}/resource_type"
+_REQUEST_METHOD_PREFIX = f"{_REQUEST_STATS_PREFIX}/method"
+_RESPONSE_RESOURCE_TYPE_PREFIX = f"{_RESPONSE_STATS_PREFIX}/resource_type"
+_RESPONSE_METHOD_PREFIX = f"{_RESPONSE_STATS_PREFIX}/method"
+_REQUEST_RESOURCE_TYPE_KEYS = _make_stats_keys(_REQUEST_RESOURCE_TYPE_PREFIX, _RESOURCE_TYPES)
+_REQUEST_METHOD_KEYS = _make_stats_keys(_REQUEST_METHOD_PREFIX, _HTTP_METHODS)
+_RESPONSE_RESOURCE_TYPE_KEYS = _make_stats_keys(_RESPONSE_RESOURCE_TYPE_PREFIX, _RESOURCE_TYPES)
+_RESPONSE_METHOD_KEYS = _make_stats_keys(_RESPONSE_METHOD_PREFIX, _HTTP_METHODS)
+_REQUEST_NAVIGATION_KEY = f"{_REQUEST_STATS_PREFIX}/navigation"
+
+
+def _get_stats_key(keys: Dict[str, str], prefix: str, value: str) -> str:
+    """Return the interned stats key for the given value, adding it to the cache if missing."""
+    key = keys.get(value)
+    if key is None:
+        key = keys[value] = sys.intern(f"{prefix}/{value}")
+    return key
 
 
 @dataclass
@@ -64,19 +155,78 @@ class BrowserContextWrapper:
     context: BrowserContext
     semaphore: asyncio.Semaphore
     persistent: bool
+    idle_pages: asyncio.LifoQueue = dataclass_field(default_factory=asyncio.LifoQueue)
+
+
+@dataclass
+class RequestState:
+    """Parameters of the Scrapy request currently being downloaded by a page,
+    read by the page's route handler.
+    """
+
+    context_name: str
+    method: str
+    url: str
+    headers: Headers
+    body: Optional[bytes]
+    spider: Spider
+    initial_request_done: bool = False
+    stripped_url: str = dataclass_field(init=False)
+    upper_method: str = dataclass_field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stripped_url = self.url.rstrip("/")
+        self.upper_method = self.method.upper()
 
 
 @dataclass
+class PageState:
+    """Bookkeeping of the download handler for a page, stored in the page's
+    _scrapy_state attribute. Pages without it were not set up by the handler.
+    """
+
+    context_wrapper: Optional[BrowserContextWrapper] = None  # None if not created here
+    uses: int = 0
+    idle: bool = False
+    reusable: bool = True
+    default_init_done: bool = False
+    event_handlers: List[Tuple[str, Callable]] = dataclass_field(default_factory=list)
+    request: Optional[RequestState] = None
+
+
 class Download:
-    body: bytes = b""
-    url: str = ""
-    suggested_filename: str = ""
-    exception: Optional[Exception] = None
-    response_status: int = 200
-    headers: dict = dataclass_field(default_factory=dict)
+    __slots__ = (
+        "body",
+        "url",
+        "suggested_filename",
+        "exception",
+        "response_status",
+        "headers",
+        "path",
+        "_triggered",
+    )
+
+    def __init__(
+        self,
+        body: bytes = b"",
+        url: str = "",
+        suggested_filename: str = "",
+        exception: Optional[Exception] = None,
+        response_status: int = 200,
+        headers: Optional[Headers] = None,
+        path: Optional[Path] = None,
+    ) -> None:
+        self.body = body
+        self.url = url
+        self.suggested_filename = suggested_filename
+        self.exception = exception
+        self.response_status = response_status
+        self.headers = headers
+        self.path = path
+        self._triggered = bool(body) or bool(exception) or path is not None
 
     def __bool__(self) -> bool:
-        return bool(self.body) or bool(self.exception)
+        return self._triggered
 
 
 @dataclass
@@ -87,6 +237,10 @@ class Config:
     startup_context_kwargs: dict
     navigation_timeout: Optional[float]
     restart_disconnected_browser: bool
+    max_uses_per_page: int = MAX_USES_PER_PAGE
+    startup_concurrency: int = STARTUP_CONCURRENCY
+    include_security_details: bool = False
+    structured_logging: bool = True
     target_closed_max_retries: int = 3
     use_threaded_loop: bool = False
     browser_type_name: str = "firefox"
@@ -104,6 +258,14 @@ class Config:
             restart_disconnected_browser=settings.getbool(
                 "CAMOUFOX_RESTART_DISCONNECTED_BROWSER", default=True
             ),
+            max_uses_per_page=settings.getint(
+                "CAMOUFOX_MAX_USES_PER_PAGE", default=MAX_USES_PER_PAGE
+            ),
+            startup_concurrency=max(
+                settings.getint("CAMOUFOX_STARTUP_CONCURRENCY", default=STARTUP_CONCURRENCY), 1
+            ),
+            include_security_details=settings.getbool("CAMOUFOX_INCLUDE_SECURITY_DETAILS"),
+            structured_logging=settings.getbool("CAMOUFOX_STRUCTURED_LOGGING", default=True),
             use_threaded_loop=platform.system() == "Windows"
             or settings.getbool("_PLAYWRIGHT_THREADED_LOOP", False),
         )
@@ -117,10 +279,13 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
     playwright: Optional[AsyncPlaywright] = None
 
     def __init__(self, crawler: Crawler) -> None:
+        _lazy_import()
         super().__init__(settings=crawler.settings, crawler=crawler)
         verify_installed_reactor("twisted.internet.asyncioreactor.AsyncioSelectorReactor")
         crawler.signals.connect(self._engine_started, signals.engine_started)
+        crawler.signals.connect(self._spider_closed, signals.spider_closed)
         self.stats = crawler.stats
+        self.crawler = crawler
         self.config = Config.from_settings(crawler.settings)
 
         if self.config.use_threaded_loop:
@@ -128,7 +293,13 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
 
         self.browser_launch_lock = asyncio.Lock()
         self.context_launch_lock = asyncio.Lock()
+        self.browser: Optional[Browser] = None
         self.context_wrappers: Dict[str, BrowserContextWrapper] = {}
+        self._total_pages = 0
+        self._page_listeners: Dict[str, Tuple[Callable, Callable, Callable]] = {}
+        self._pending_stats: Counter = Counter()
+        self._stats_flush_handle: Optional[asyncio.TimerHandle] = None
+        self.context_semaphore: Optional[asyncio.Semaphore] = None
         if self.config.max_contexts:
             self.context_semaphore = asyncio.Semaphore(value=self.config.max_contexts)
 
@@ -136,6 +307,12 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
         if crawler.settings.get("CAMOUFOX_ABORT_REQUEST"):
             self.abort_request = load_object(crawler.settings["CAMOUFOX_ABORT_REQUEST"])
 
+        self.default_page_init_callback: Optional[Callable[[Page, Request], Awaitable]] = None
+        if crawler.settings.get("CAMOUFOX_DEFAULT_PAGE_INIT_CALLBACK"):
+            self.default_page_init_callback = load_object(
+                crawler.settings["CAMOUFOX_DEFAULT_PAGE_INIT_CALLBACK"]
+            )
+
     @classmethod
     def from_crawler(cls: Type[PlaywrightHandler], crawler: Crawler) -> PlaywrightHandler:
         return cls(crawler)
@@ -149,16 +326,37 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
         """Launch the browser. Use the engine_started signal as it supports returning deferreds."""
         return self._deferred_from_coro(self._launch())
 
+    def _spider_closed(self) -> Deferred:
+        """Apply the pending stats, they are dumped before download handlers are closed.
+        Done in the Playwright loop, which might run in a different thread.
+        """
+        # drop the cached references to the spider and its handlers
+        _resolve_page_event_handlers.cache_clear()
+        return self._deferred_from_coro(self._stop_stats_flush())
+
+    async def _stop_stats_flush(self) -> None:
+        if self._stats_flush_handle is not None:
+            self._stats_flush_handle.cancel()
+            self._stats_flush_handle = None
+        self._flush_stats()
+
     async def _launch(self) -> None:
         """Launch Playwright manager and configured startup context(s)."""
         logger.info("Starting download handler")
         self.playwright_context_manager = PlaywrightContextManager()
         self.playwright = await self.playwright_context_manager.start()
+        self._schedule_stats_flush()
         if self.config.startup_context_kwargs:
             logger.info("Launching %i startup context(s)", len(self.config.startup_context_kwargs))
+            startup_semaphore = asyncio.Semaphore(value=self.config.startup_concurrency)
+
+            async def _create_startup_context(name: str, kwargs: dict) -> None:
+                async with startup_semaphore:
+                    await self._create_browser_context(name=name, context_kwargs=kwargs)
+
             await asyncio.gather(
                 *[
-                    self._create_browser_context(name=name, context_kwargs=kwargs)
+                    _create_startup_context(name, kwargs)
                     for name, kwargs in self.config.startup_context_kwargs.items()
                 ]
             )
@@ -168,7 +366,7 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
 
     async def _maybe_launch_browser(self, persistent: bool = False) -> None:
         async with self.browser_launch_lock:
-            if not hasattr(self, "browser"):
+            if self.browser is None:
                 logger.info("Launching browser")
                 self.browser = await AsyncNewBrowser(playwright=self.playwright, **self.config.launch_options, persistent_context=persistent)
                 logger.info("Browser launched")
@@ -184,7 +382,7 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
         """Create a new context, also launching a local browser or connecting
         to a remote one if necessary.
         """
-        if hasattr(self, "context_semaphore"):
+        if self.context_semaphore is not None:
             await self.context_semaphore.acquire()
         context_kwargs = context_kwargs or {}
         persistent = False 
@@ -196,32 +394,48 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
             context = await self.browser.new_context(**context_kwargs)
 
         context.on(
-            "close", self._make_close_browser_context_callback(name, persistent, spider)
+            "close", partial(self._close_browser_context_callback, name, persistent, spider)
         )
         self.stats.inc_value("camoufox/context_count")
         self.stats.inc_value(f"camoufox/context_count/persistent/{persistent}")
-        logger.debug(
-            "Browser context started: '%s' (persistent=%s)",
-            name,
-            persistent,
-            extra={
-                "spider": spider,
-                "context_name": name,
-                "persistent": persistent,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Browser context started: '%s' (persistent=%s)",
+                name,
+                persistent,
+                extra={
+                    "spider": spider,
+                    "context_name": name,
+                    "persistent": persistent,
+                },
+            )
         if self.config.navigation_timeout is not None:
             context.set_default_navigation_timeout(self.config.navigation_timeout)
-        self.context_wrappers[name] = BrowserContextWrapper(
+        ctx_wrapper = BrowserContextWrapper(
             context=context,
             semaphore=asyncio.Semaphore(value=self.config.max_pages_per_context),
             persistent=persistent,
+            idle_pages=asyncio.LifoQueue(maxsize=self.config.max_pages_per_context),
         )
+        self.context_wrappers[name] = ctx_wrapper
         self._set_max_concurrent_context_count()
-        return self.context_wrappers[name]
+        # pre-warm the page pool so the first requests don't pay the page creation cost,
+        # concurrently since this can run while holding the context launch lock
+        pages = await asyncio.gather(
+            *[
+                self._new_page(ctx_wrapper=ctx_wrapper, context_name=name)
+                for _ in range(self.config.max_pages_per_context // 2)
+            ]
+        )
+        for page in pages:
+            page._scrapy_state.idle = True
+            ctx_wrapper.idle_pages.put_nowait(page)
+        return ctx_wrapper
 
     async def _create_page(self, request: Request, spider: Spider) -> Page:
-        """Create a new page in a context, also creating a new context if necessary."""
+        """Check out an idle page from a context's pool, creating a new page
+        (and a new context) if necessary.
+        """
         context_name = request.meta.setdefault("camoufox_context", DEFAULT_CONTEXT_NAME)
         # this block needs to be locked because several attempts to launch a context
         # with the same name could happen at the same time from different requests
@@ -235,44 +449,110 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                 )
 
         await ctx_wrapper.semaphore.acquire()
+        page: Optional[Page] = None
+        while not ctx_wrapper.idle_pages.empty():
+            idle_page = ctx_wrapper.idle_pages.get_nowait()
+            if not idle_page.is_closed():
+                page = idle_page
+                break
+        if page is None:
+            page = await self._new_page(ctx_wrapper=ctx_wrapper, context_name=context_name)
+        page._scrapy_state.idle = False
+        if logger.isEnabledFor(logging.DEBUG):
+            context_page_count = len(ctx_wrapper.context.pages)
+            logger.debug(
+                "[Context=%s] Page checked out, page count is %i (%i for all contexts)",
+                context_name,
+                context_page_count,
+                self._total_pages,
+                extra={
+                    "spider": spider,
+                    "context_name": context_name,
+                    "context_page_count": context_page_count,
+                    "total_page_count": self._total_pages,
+                    "scrapy_request_url": request.url,
+                    "scrapy_request_method": request.method,
+                },
+            )
+        return page
+
+    async def _new_page(self, ctx_wrapper: BrowserContextWrapper, context_name: str) -> Page:
+        """Create a new page in a context and wire up its long-lived event listeners."""
         page = await ctx_wrapper.context.new_page()
+        page._scrapy_state = page_state = PageState(context_wrapper=ctx_wrapper)
+        await page.route("**", partial(self._persistent_route_handler, page_state))
+        self._total_pages += 1
         self.stats.inc_value("camoufox/page_count")
-        total_page_count = self._get_total_page_count()
-        logger.debug(
-            "[Context=%s] New page created, page count is %i (%i for all contexts)",
-            context_name,
-            len(ctx_wrapper.context.pages),
-            total_page_count,
-            extra={
-                "spider": spider,
-                "context_name": context_name,
-                "context_page_count": len(ctx_wrapper.context.pages),
-                "total_page_count": total_page_count,
-                "scrapy_request_url": request.url,
-                "scrapy_request_method": request.method,
-            },
-        )
         self._set_max_concurrent_page_count()
         if self.config.navigation_timeout is not None:
             page.set_default_navigation_timeout(self.config.navigation_timeout)
 
-        page.on("close", self._make_close_page_callback(context_name))
-        page.on("crash", self._make_close_page_callback(context_name))
-        page.on("request", _make_request_logger(context_name, spider))
-        page.on("response", _make_response_logger(context_name, spider))
-        page.on("request", self._increment_request_stats)
-        page.on("response", self._increment_response_stats)
+        close_page_callback, request_listener, response_listener = self._get_page_listeners(
+            context_name
+        )
+        page.on("close", close_page_callback)
+        page.on("crash", close_page_callback)
+        page.on("request", request_listener)
+        page.on("response", response_listener)
 
         return page
 
+    def _get_page_listeners(self, context_name: str) -> Tuple[Callable, Callable, Callable]:
+        """Return the close/crash callback and the request and response listeners
+        for the pages of a context, shared by all of them.
+        """
+        listeners = self._page_listeners.get(context_name)
+        if listeners is None:
+            listeners = self._page_listeners[context_name] = (
+                partial(self._close_page_callback, context_name),
+                partial(self._on_request, context_name),
+                partial(self._on_response, context_name),
+            )
+        return listeners
+
+    async def _recycle_page(self, page: Page) -> None:
+        """Return a page to its context's pool of idle pages. The page is closed
+        instead if it was not created by this handler, if it ran page methods or
+        an init callback, if it has reached the maximum amount of uses, if the pool
+        is full or if it cannot be reset to a blank state.
+        """
+        page_state: PageState = page._scrapy_state
+        if page.is_closed() or page_state.idle:
+            return
+        ctx_wrapper = page_state.context_wrapper
+        page_state.uses += 1
+        if (
+            ctx_wrapper is None
+            or not page_state.reusable
+            or page_state.uses >= self.config.max_uses_per_page
+            or ctx_wrapper.idle_pages.full()
+        ):
+            await page.close()
+            self.stats.inc_value("camoufox/page_count/closed")
+            return
+        for event, handler in page_state.event_handlers:
+            page.remove_listener(event, handler)
+        page_state.event_handlers.clear()
+        page_state.request = None
+        try:
+            await page.goto("about:blank")
+        except PlaywrightError:
+            if not page.is_closed():
+                await page.close()
+                self.stats.inc_value("camoufox/page_count/closed")
+            return
+        page_state.idle = True
+        ctx_wrapper.semaphore.release()
+        ctx_wrapper.idle_pages.put_nowait(page)
+        self.stats.inc_value("camoufox/page_count/recycled")
+
     def _get_total_page_count(self):
-        return sum(len(ctx.context.pages) for ctx in self.context_wrappers.values())
+        return self._total_pages
 
     def _set_max_concurrent_page_count(self):
-        count = self._get_total_page_count()
         current_max_count = self.stats.get_value("camoufox/page_count/max_concurrent")
-        if current_max_count is None or count > current_max_count:
-            self.stats.set_value("camoufox/page_count/max_concurrent", count)
+        if current_max_count is None or self._total_pages > current_max_count:
+            self.stats.set_value("camoufox/page_count/max_concurrent", self._total_pages)
 
     def _set_max_concurrent_context_count(self):
         current_max_count = self.stats.get_value("camoufox/context_count/max_concurrent")
@@ -290,10 +570,11 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
             _ThreadedLoopAdapter.stop(id(self))
 
     async def _close(self) -> None:
+        await self._stop_stats_flush()
         with suppress(TargetClosedError):
             await asyncio.gather(*[ctx.context.close() for ctx in self.context_wrappers.values()])
         self.context_wrappers.clear()
-        if hasattr(self, "browser"):
+        if self.browser is not None:
             logger.info("Closing browser")
             await self.browser.close()
         if self.playwright_context_manager:
@@ -315,59 +596,81 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                 counter += 1
                 if counter > self.config.target_closed_max_retries:
                     raise ex
-                logger.debug(
-                    "Target closed, retrying to create page for %s",
-                    request,
-                    extra={
-                        "spider": spider,
-                        "scrapy_request_url": request.url,
-                        "scrapy_request_method": request.method,
-                        "exception": ex,
-                    },
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Target closed, retrying to create page for %s",
+                        request,
+                        extra={
+                            "spider": spider,
+                            "scrapy_request_url": request.url,
+                            "scrapy_request_method": request.method,
+                            "exception": ex,
+                        },
+                    )
 
     async def _download_request_with_retry(self, request: Request, spider: Spider) -> Response:
-        page = request.meta.get("camoufox_page")
+        meta = request.meta
+        page = meta.get("camoufox_page")
         if not isinstance(page, Page) or page.is_closed():
             page = await self._create_page(request=request, spider=spider)
-        context_name = request.meta.setdefault("camoufox_context", DEFAULT_CONTEXT_NAME)
-
-        _attach_page_event_handlers(
-            page=page, request=request, spider=spider, context_name=context_name
-        )
+        context_name = meta.setdefault("camoufox_context", DEFAULT_CONTEXT_NAME)
+
+        page_state: Optional[PageState] = getattr(page, "_scrapy_state", None)
+        if page_state is None:
+            # the page was not created by this handler, install the route handler once
+            page._scrapy_state = page_state = PageState()
+            await page.route("**", partial(self._persistent_route_handler, page_state))
+
+        event_handlers = meta.get("camoufox_page_event_handlers")
+        if event_handlers:
+            page_state.event_handlers.extend(
+                _attach_page_event_handlers(
+                    page=page,
+                    request=request,
+                    spider=spider,
+                    context_name=context_name,
+                    event_handlers=event_handlers,
+                )
+            )
 
         # We need to identify the Playwright request that matches the Scrapy request
         # in order to override method and body if necessary.
         # Checking the URL and Request.is_navigation_request() is not enough, e.g.
         # requests produced by submitting forms can produce false positives.
         # Let's track only the first request that matches the above conditions.
-        initial_request_done = asyncio.Event()
+        page_state.request = RequestState(
+            context_name=context_name,
+            method=request.method,
+            url=request.url,
+            headers=request.headers,
+            body=request.body,
+            spider=spider,
+        )
 
-        await page.unroute("**")
-        await page.route(
-            "**",
-            self._make_request_handler(
+        page_init_callback = meta.get("camoufox_page_init_callback")
+        if page_init_callback or meta.get("camoufox_page_methods"):
+            # routes, init scripts, extra headers, viewport changes and such
+            # cannot be undone, do not hand the page over to other requests
+            page_state.reusable = False
+        if not page_init_callback and not page_state.default_init_done:
+            # the default callback runs once per page, its changes are kept across reuses
+            page_init_callback = self.default_page_init_callback
+            page_state.default_init_done = True
+        if page_init_callback:
+            await _execute_page_init_callback(
+                page=page,
+                request=request,
                 context_name=context_name,
-                method=request.method,
-                url=request.url,
-                headers=request.headers,
-                body=request.body,
-                encoding=request.encoding,
                 spider=spider,
-                initial_request_done=initial_request_done,
-            ),
-        )
-
-        await _maybe_execute_page_init_callback(
-            page=page, request=request, context_name=context_name, spider=spider
-        )
+                page_init_callback=page_init_callback,
+            )
 
         try:
             return await self._download_request_with_page(request, page, spider)
         except Exception as ex:
             if not request.meta.get("camoufox_include_page") and not page.is_closed():
                 logger.warning(
-                    "Closing page due to failed request: %s exc_type=%s exc_msg=%s",
+                    "Releasing page due to failed request: %s exc_type=%s exc_msg=%s",
                     request,
                     type(ex),
                     str(ex),
@@ -380,9 +683,11 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                     },
                     exc_info=True,
                 )
-                await page.close()
-                self.stats.inc_value("camoufox/page_count/closed")
             raise
+        finally:
+            # recycle exactly once, after the response has been built
+            if not request.meta.get("camoufox_include_page"):
+                await self._recycle_page(page)
 
     async def _download_request_with_page(
         self, request: Request, page: Page, spider: Spider
@@ -394,7 +699,8 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
         start_time = time()
         response, download = await self._get_response_and_download(request, page, spider)
         if isinstance(response, PlaywrightResponse):
-            await _set_redirect_meta(request=request, response=response)
+            if response.request.redirected_from is not None:
+                await _set_redirect_meta(request=request, response=response)
             headers = Headers(await response.all_headers())
             headers.pop("Content-Encoding", None)
         elif not download:
@@ -422,7 +728,10 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
         request.meta["download_latency"] = time() - start_time
 
         server_ip_address = None
-        if response is not None:
+        if response is not None and (
+            request.meta.get("camoufox_include_security_details")
+            or self.config.include_security_details
+        ):
             request.meta["camoufox_security_details"] = await response.security_details()
             with suppress(KeyError, TypeError, ValueError):
                 server_addr = await response.server_addr()
@@ -431,14 +740,12 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
         if download and download.exception:
             raise download.exception
 
-        if not request.meta.get("camoufox_include_page"):
-            await page.close()
-            self.stats.inc_value("camoufox/page_count/closed")
-
         if download:
             request.meta["camoufox_suggested_filename"] = download.suggested_filename
+            if download.path is not None:
+                request.meta["camoufox_download_path"] = str(download.path)
             respcls = responsetypes.from_args(url=download.url, body=download.body)
-            download_headers = Headers(download.headers)
+            download_headers = download.headers if download.headers is not None else Headers()
             download_headers.pop("Content-Encoding", None)
             return respcls(
                 url=download.url,
@@ -449,8 +756,11 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                 flags=["camoufox"],
             )
 
-        body, encoding = _encode_body(headers=headers, text=body_str)
-        respcls = responsetypes.from_args(headers=headers, url=page.url, body=body)
+        if len(body_str) > ENCODE_BODY_THREAD_THRESHOLD:
+            body, encoding = await asyncio.to_thread(_encode_body, headers, body_str)
+        else:
+            body, encoding = _encode_body(headers=headers, text=body_str)
+        respcls = _get_response_class(headers=headers, url=page.url, body=body)
         return respcls(
             url=page.url,
             status=response.status if response is not None else 200,
@@ -464,7 +774,7 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
 
     async def _get_response_and_download(
         self, request: Request, page: Page, spider: Spider
-    ) -> Tuple[Optional[PlaywrightResponse], Optional[Download]]:
+    ) -> Tuple[Optional[PlaywrightResponse], Download]:
         response: Optional[PlaywrightResponse] = None
         download: Download = Download()  # updated in-place in _handle_download
         download_started = asyncio.Event()
@@ -476,17 +786,23 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
             try:
                 if failure := await dwnld.failure():
                     raise RuntimeError(f"Failed to download {dwnld.url}: {failure}")
-                download.body = (await dwnld.path()).read_bytes()
+                path = await dwnld.path()
+                if request.meta.get("camoufox_download_stream"):
+                    download.path = path
+                else:
+                    # read in a thread, large files would block the event loop
+                    download.body = await asyncio.to_thread(path.read_bytes)
                 download.url = dwnld.url
                 download.suggested_filename = dwnld.suggested_filename
             except Exception as ex:
                 download.exception = ex
             finally:
+                download._triggered = True
                 download_ready.set()
 
         async def _handle_response(response: PlaywrightResponse) -> None:
             download.response_status = response.status
-            download.headers = await response.all_headers()
+            download.headers = Headers(await response.all_headers())
             download_started.set()
 
         page_goto_kwargs = request.meta.get("camoufox_page_goto_kwargs") or {}
@@ -502,43 +818,46 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
             ):
                 raise
 
-            logger.debug(
-                "Navigating to %s failed",
-                request.url,
-                extra={
-                    "spider": spider,
-                    "context_name": request.meta.get("camoufox_context"),
-                    "scrapy_request_url": request.url,
-                    "scrapy_request_method": request.method,
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Navigating to %s failed",
+                    request.url,
+                    extra={
+                        "spider": spider,
+                        "context_name": request.meta.get("camoufox_context"),
+                        "scrapy_request_url": request.url,
+                        "scrapy_request_method": request.method,
+                    },
+                )
             await download_started.wait()
 
             if download.response_status == 204:
                 raise err
 
-            logger.debug(
-                "Waiting on download to finish for %s",
-                request.url,
-                extra={
-                    "spider": spider,
-                    "context_name": request.meta.get("camoufox_context"),
-                    "scrapy_request_url": request.url,
-                    "scrapy_request_method": request.method,
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Waiting on download to finish for %s",
+                    request.url,
+                    extra={
+                        "spider": spider,
+                        "context_name": request.meta.get("camoufox_context"),
+                        "scrapy_request_url": request.url,
+                        "scrapy_request_method": request.method,
+                    },
+                )
             await download_ready.wait()
         finally:
             page.remove_listener("download", _handle_download)
             page.remove_listener("response", _handle_response)
 
-        return response, download if download else None
+        return response, download
 
     async def _apply_page_methods(self, page: Page, request: Request, spider: Spider) -> None:
         context_name = request.meta.get("camoufox_context")
         page_methods = request.meta.get("camoufox_page_methods") or ()
         if isinstance(page_methods, dict):
             page_methods = page_methods.values()
+        pending_load_state_wait = False
         for pm in page_methods:
             if isinstance(pm, PageMethod):
                 try:
@@ -561,7 +880,9 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                     )
                 else:
                     pm.result = await _maybe_await(method(*pm.args, **pm.kwargs))
-                    await page.wait_for_load_state(timeout=self.config.navigation_timeout)
+                    if pm.should_wait_for_load_state:
+                        await page.wait_for_load_state(timeout=self.config.navigation_timeout)
+                    pending_load_state_wait = not pm.should_wait_for_load_state
             else:
                 logger.warning(
                     "Ignoring %r: expected PageMethod, got %r",
@@ -574,20 +895,64 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                         "scrapy_request_method": request.method,
                     },
                 )
+        if pending_load_state_wait:
+            await page.wait_for_load_state(timeout=self.config.navigation_timeout)
 
     def _increment_request_stats(self, request: PlaywrightRequest) -> None:
-        stats_prefix = "camoufox/request_count"
-        self.stats.inc_value(stats_prefix)
-        self.stats.inc_value(f"{stats_prefix}/resource_type/{request.resource_type}")
-        self.stats.inc_value(f"{stats_prefix}/method/{request.method}")
+        pending_stats = self._pending_stats
+        pending_stats[_REQUEST_STATS_PREFIX] += 1
+        pending_stats[
+            _get_stats_key(
+                _REQUEST_RESOURCE_TYPE_KEYS, _REQUEST_RESOURCE_TYPE_PREFIX, request.resource_type
+            )
+        ] += 1
+        pending_stats[
+            _get_stats_key(_REQUEST_METHOD_KEYS, _REQUEST_METHOD_PREFIX, request.method)
+        ] += 1
         if request.is_navigation_request():
-            self.stats.inc_value(f"{stats_prefix}/navigation")
+            pending_stats[_REQUEST_NAVIGATION_KEY] += 1
 
     def _increment_response_stats(self, response: PlaywrightResponse) -> None:
-        stats_prefix = "camoufox/response_count"
-        self.stats.inc_value(stats_prefix)
-        self.stats.inc_value(f"{stats_prefix}/resource_type/{response.request.resource_type}")
-        self.stats.inc_value(f"{stats_prefix}/method/{response.request.method}")
+        pending_stats = self._pending_stats
+        pending_stats[_RESPONSE_STATS_PREFIX] += 1
+        pending_stats[
+            _get_stats_key(
+                _RESPONSE_RESOURCE_TYPE_KEYS,
+                _RESPONSE_RESOURCE_TYPE_PREFIX,
+                response.request.resource_type,
+            )
+        ] += 1
+        pending_stats[
+            _get_stats_key(_RESPONSE_METHOD_KEYS, _RESPONSE_METHOD_PREFIX, response.request.method)
+        ] += 1
+
+    def _on_request(self, context_name: str, request: PlaywrightRequest) -> None:
+        """Update the request stats, and log the request if debug logging is enabled."""
+        self._increment_request_stats(request)
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_request(
+                request, context_name, self.crawler.spider, self.config.structured_logging
+            )
+
+    def _on_response(self, context_name: str, response: PlaywrightResponse) -> None:
+        """Update the response stats, and log the response if debug logging is enabled."""
+        self._increment_response_stats(response)
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_response(
+                response, context_name, self.crawler.spider, self.config.structured_logging
+            )
+
+    def _flush_stats(self) -> None:
+        """Apply the request/response counts accumulated by the page event listeners."""
+        for key, count in self._pending_stats.items():
+            self.stats.inc_value(key, count=count)
+        self._pending_stats.clear()
+
+    def _schedule_stats_flush(self) -> None:
+        self._flush_stats()
+        self._stats_flush_handle = asyncio.get_running_loop().call_later(
+            STATS_FLUSH_INTERVAL, self._schedule_stats_flush
+        )
 
     async def _browser_disconnected_callback(self) -> None:
         close_context_coros = [
@@ -598,22 +963,29 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
             await asyncio.gather(*close_context_coros)
         logger.debug("Browser disconnected")
         if self.config.restart_disconnected_browser:
-            del self.browser
-
-    def _make_close_page_callback(self, context_name: str) -> Callable:
-        def close_page_callback() -> None:
-            if context_name in self.context_wrappers:
-                self.context_wrappers[context_name].semaphore.release()
-
-        return close_page_callback
-
-    def _make_close_browser_context_callback(
+            self.browser = None
+
+    def _close_page_callback(self, context_name: str, page: Page) -> None:
+        # this callback also handles the "crash" event, which does not close the page
+        if page.is_closed():
+            self._total_pages -= 1
+            self._flush_stats()
+        # idle pages have already released their slot in the context semaphore
+        page_state: PageState = page._scrapy_state
+        if page_state.idle:
+            return
+        page_state.idle = True
+        if context_name in self.context_wrappers:
+            self.context_wrappers[context_name].semaphore.release()
+
+    def _close_browser_context_callback(
         self, name: str, persistent: bool, spider: Optional[Spider] = None
-    ) -> Callable:
-        def close_browser_context_callback() -> None:
-            self.context_wrappers.pop(name, None)
-            if hasattr(self, "context_semaphore"):
-                self.context_semaphore.release()
+    ) -> None:
+        self.context_wrappers.pop(name, None)
+        self._page_listeners.pop(name, None)
+        if self.context_semaphore is not None:
+            self.context_semaphore.release()
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Browser context closed: '%s' (persistent=%s)",
                 name,
@@ -625,226 +997,278 @@ class ScrapyCamoufoxDownloadHandler(HTTPDownloadHandler):
                 },
             )
 
-        return close_browser_context_callback
-
-    def _make_request_handler(
-        self,
-        context_name: str,
-        method: str,
-        url: str,
-        headers: Headers,
-        body: Optional[bytes],
-        encoding: str,
-        spider: Spider,
-        initial_request_done: asyncio.Event,
-    ) -> Callable:
-        async def _request_handler(route: Route, playwright_request: PlaywrightRequest) -> None:
-            """Override request headers, method and body."""
-            if self.abort_request:
-                should_abort = await _maybe_await(self.abort_request(playwright_request))
-                if should_abort:
-                    await route.abort()
+    async def _persistent_route_handler(
+        self, page_state: PageState, route: Route, playwright_request: PlaywrightRequest
+    ) -> None:
+        """Override request headers, method and body.
+        Installed once per page, reads the parameters of the current Scrapy request
+        from the state stored on the page.
+        """
+        state = page_state.request
+        if state is None:
+            await route.continue_()
+            return None
+
+        if self.abort_request:
+            should_abort = await _maybe_await(self.abort_request(playwright_request))
+            if should_abort:
+                await route.abort()
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         "[Context=%s] Aborted Camoufox request <%s %s>",
-                        context_name,
-                        playwright_request.method.upper(),
+                        state.context_name,
+                        playwright_request.method,
                         playwright_request.url,
                         extra={
-                            "spider": spider,
-                            "context_name": context_name,
-                            "scrapy_request_url": url,
-                            "scrapy_request_method": method,
+                            "spider": state.spider,
+                            "context_name": state.context_name,
+                            "scrapy_request_url": state.url,
+                            "scrapy_request_method": state.method,
                             "playwright_request_url": playwright_request.url,
                             "playwright_request_method": playwright_request.method,
                         },
                     )
-                    self.stats.inc_value("camoufox/request_count/aborted")
-                    return None
-
-            overrides: dict = {}
-
+                self.stats.inc_value("camoufox/request_count/aborted")
+                return None
+
+        overrides: dict = {}
+
+        # cheapest checks first, rstrip can only make the Playwright request URL shorter
+        if (
+            not state.initial_request_done
+            and len(playwright_request.url) >= len(state.stripped_url)
+            and playwright_request.is_navigation_request()
+            and playwright_request.url.rstrip("/") == state.stripped_url
+        ):
+            state.initial_request_done = True
+            if state.upper_method != playwright_request.method.upper():
+                overrides["method"] = state.method
+            if state.body:
+                # Route.continue_ accepts bytes, no need to decode the body
+                overrides["post_data"] = state.body
+            # the request that reaches the callback should contain the final headers
             final_headers = await playwright_request.all_headers()
-            
-            if (
-                playwright_request.url.rstrip("/") == url.rstrip("/")
-                and playwright_request.is_navigation_request()
-                and not initial_request_done.is_set()
-            ):
-                initial_request_done.set()
-                if method.upper() != playwright_request.method.upper():
-                    overrides["method"] = method
-                if body:
-                    overrides["post_data"] = body.decode(encoding)
-                # the request that reaches the callback should contain the final headers
-                headers.clear()
-                headers.update(final_headers)
-
-            del final_headers
-
-            original_playwright_method: str = playwright_request.method
-            try:
-                await route.continue_(**overrides)
-                if overrides.get("method"):
+            state.headers.clear()
+            state.headers.update(final_headers)
+
+        original_playwright_method: str = playwright_request.method
+        try:
+            await route.continue_(**overrides)
+            if overrides.get("method"):
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         "[Context=%s] Overridden method for Camoufox request"
                         " to %s: original=%s new=%s",
-                        context_name,
+                        state.context_name,
                         playwright_request.url,
                         original_playwright_method,
                         overrides["method"],
                         extra={
-                            "spider": spider,
-                            "context_name": context_name,
-                            "scrapy_request_url": url,
-                            "scrapy_request_method": method,
+                            "spider": state.spider,
+                            "context_name": state.context_name,
+                            "scrapy_request_url": state.url,
+                            "scrapy_request_method": state.method,
                             "playwright_request_url": playwright_request.url,
                             "playwright_request_method_original": original_playwright_method,
                             "playwright_request_method_new": overrides["method"],
                         },
                     )
-            except PlaywrightError as ex:
-                if _is_safe_close_error(ex):
-                    logger.warning(
-                        "Failed processing Camoufox request: <%s %s> exc_type=%s exc_msg=%s",
-                        playwright_request.method,
-                        playwright_request.url,
-                        type(ex),
-                        str(ex),
-                        extra={
-                            "spider": spider,
-                            "context_name": context_name,
-                            "scrapy_request_url": url,
-                            "scrapy_request_method": method,
-                            "playwright_request_url": playwright_request.url,
-                            "playwright_request_method": playwright_request.method,
-                            "exception": ex,
-                        },
-                        exc_info=True,
-                    )
-                else:
-                    raise
-
-        return _request_handler
-
-
-def _attach_page_event_handlers(
-    page: Page, request: Request, spider: Spider, context_name: str
-) -> None:
-    event_handlers = request.meta.get("camoufox_page_event_handlers") or {}
-    for event, handler in event_handlers.items():
-        if callable(handler):
-            page.on(event, handler)
-        elif isinstance(handler, str):
-            try:
-                page.on(event, getattr(spider, handler))
-            except AttributeError as ex:
+        except PlaywrightError as ex:
+            if _is_safe_close_error(ex):
                 logger.warning(
-                    "Spider '%s' does not have a '%s' attribute,"
-                    " ignoring handler for event '%s'",
-                    spider.name,
-                    handler,
-                    event,
+                    "Failed processing Camoufox request: <%s %s> exc_type=%s exc_msg=%s",
+                    playwright_request.method,
+                    playwright_request.url,
+                    type(ex),
+                    str(ex),
                     extra={
-                        "spider": spider,
-                        "context_name": context_name,
-                        "scrapy_request_url": request.url,
-                        "scrapy_request_method": request.method,
+                        "spider": state.spider,
+                        "context_name": state.context_name,
+                        "scrapy_request_url": state.url,
+                        "scrapy_request_method": state.method,
+                        "playwright_request_url": playwright_request.url,
+                        "playwright_request_method": playwright_request.method,
                         "exception": ex,
                     },
                     exc_info=True,
                 )
+            else:
+                raise
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _resolve_page_event_handlers(
+    spider: Spider, event_handlers: Tuple[Tuple[str, Any], ...]
+) -> Tuple[Tuple[Tuple[str, Callable], ...], Tuple[Tuple[str, str], ...]]:
+    """Resolve the handlers of the camoufox_page_event_handlers meta key, looking up
+    spider attributes for string values. Returns the resolved (event, callable) pairs
+    and the (event, attribute name) pairs that could not be found in the spider.
+    """
+    resolved: List[Tuple[str, Callable]] = []
+    missing: List[Tuple[str, str]] = []
+    for event, handler in event_handlers:
+        if callable(handler):
+            resolved.append((event, handler))
+        elif isinstance(handler, str):
+            spider_handler = getattr(spider, handler, _MISSING)
+            if spider_handler is _MISSING:
+                missing.append((event, handler))
+            else:
+                resolved.append((event, spider_handler))
+    return tuple(resolved), tuple(missing)
+
+
+def _attach_page_event_handlers(
+    page: Page,
+    request: Request,
+    spider: Spider,
+    context_name: str,
+    event_handlers: dict,
+) -> Tuple[Tuple[str, Callable], ...]:
+    """Attach the request's event handlers (from the camoufox_page_event_handlers
+    meta key) to the page, returning them so they can be removed before the page is reused.
+    """
+    handler_items = tuple(event_handlers.items())
+    try:
+        resolved, missing = _resolve_page_event_handlers(spider, handler_items)
+    except TypeError:  # unhashable handlers, resolve without caching
+        resolved, missing = _resolve_page_event_handlers.__wrapped__(spider, handler_items)
+    for event, handler in resolved:
+        page.on(event, handler)
+    for event, handler in missing:
+        logger.warning(
+            "Spider '%s' does not have a '%s' attribute, ignoring handler for event '%s'",
+            spider.name,
+            handler,
+            event,
+            extra={
+                "spider": spider,
+                "context_name": context_name,
+                "scrapy_request_url": request.url,
+                "scrapy_request_method": request.method,
+            },
+        )
+    return resolved
 
 
 async def _set_redirect_meta(request: Request, response: PlaywrightResponse) -> None:
     """Update a Scrapy request with metadata about redirects."""
-    redirect_times: int = 0
-    redirect_urls: list = []
-    redirect_reasons: list = []
+    # the chain of requests is available synchronously, only responses need to be awaited
+    redirect_chain: List[PlaywrightRequest] = []
     redirected = response.request.redirected_from
     while redirected is not None:
-        redirect_times += 1
-        redirect_urls.append(redirected.url)
-        redirected_response = await redirected.response()
-        reason = None if redirected_response is None else redirected_response.status
-        redirect_reasons.append(reason)
+        redirect_chain.append(redirected)
         redirected = redirected.redirected_from
-    if redirect_times:
-        request.meta["redirect_times"] = redirect_times
-        request.meta["redirect_urls"] = list(reversed(redirect_urls))
-        request.meta["redirect_reasons"] = list(reversed(redirect_reasons))
+    if redirect_chain:
+        redirect_chain.reverse()  # in place, oldest request first
+        redirected_responses = await asyncio.gather(
+            *[redirected.response() for redirected in redirect_chain], return_exceptions=True
+        )
+        request.meta.update(
+            {
+                "redirect_times": len(redirect_chain),
+                "redirect_urls": [redirected.url for redirected in redirect_chain],
+                "redirect_reasons": [
+                    None if resp is None or isinstance(resp, BaseException) else resp.status
+                    for resp in redirected_responses
+                ],
+            }
+        )
+
+
+@lru_cache(maxsize=256)
+def _load_page_init_callback(path: str) -> Callable:
+    return load_object(path)
 
 
-async def _maybe_execute_page_init_callback(
+async def _execute_page_init_callback(
     page: Page,
     request: Request,
     context_name: str,
     spider: Spider,
+    page_init_callback: Union[str, Callable],
 ) -> None:
-    page_init_callback = request.meta.get("camoufox_page_init_callback")
-    if page_init_callback:
-        try:
-            page_init_callback = load_object(page_init_callback)
-            await page_init_callback(page, request)
-        except Exception as ex:
-            logger.warning(
-                "[Context=%s] Page init callback exception for %s exc_type=%s exc_msg=%s",
-                context_name,
-                repr(request),
-                type(ex),
-                str(ex),
-                extra={
-                    "spider": spider,
-                    "context_name": context_name,
-                    "scrapy_request_url": request.url,
-                    "scrapy_request_method": request.method,
-                    "exception": ex,
-                },
-                exc_info=True,
-            )
-
-
-def _make_request_logger(context_name: str, spider: Spider) -> Callable:
-    async def _log_request(request: PlaywrightRequest) -> None:
-        log_args = [context_name, request.method.upper(), request.url, request.resource_type]
-        referrer = await _get_header_value(request, "referer")
-        if referrer:
-            log_args.append(referrer)
-            log_msg = "[Context=%s] Request: <%s %s> (resource type: %s, referrer: %s)"
-        else:
-            log_msg = "[Context=%s] Request: <%s %s> (resource type: %s)"
-        logger.debug(
-            log_msg,
-            *log_args,
+    """Call the camoufox_page_init_callback meta key, already read by the caller."""
+    try:
+        if isinstance(page_init_callback, str):
+            page_init_callback = _load_page_init_callback(page_init_callback)
+        await page_init_callback(page, request)
+    except Exception as ex:
+        logger.warning(
+            "[Context=%s] Page init callback exception for %s exc_type=%s exc_msg=%s",
+            context_name,
+            repr(request),
+            type(ex),
+            str(ex),
             extra={
                 "spider": spider,
                 "context_name": context_name,
-                "playwright_request_url": request.url,
-                "playwright_request_method": request.method,
-                "playwright_resource_type": request.resource_type,
+                "scrapy_request_url": request.url,
+                "scrapy_request_method": request.method,
+                "exception": ex,
             },
+            exc_info=True,
         )
 
-    return _log_request
 
+_REQUEST_LOG_MSG = "[Context=%s] Request: <%s %s> (resource type: %s)"
+_REQUEST_LOG_MSG_REFERRER = "[Context=%s] Request: <%s %s> (resource type: %s, referrer: %s)"
+_RESPONSE_LOG_MSG = "[Context=%s] Response: <%i %s>"
+_RESPONSE_LOG_MSG_LOCATION = "[Context=%s] Response: <%i %s> (location: %s)"
 
-def _make_response_logger(context_name: str, spider: Spider) -> Callable:
-    async def _log_response(response: PlaywrightResponse) -> None:
-        log_args = [context_name, response.status, response.url]
-        location = await _get_header_value(response, "location")
-        if location:
-            log_args.append(location)
-            log_msg = "[Context=%s] Response: <%i %s> (location: %s)"
-        else:
-            log_msg = "[Context=%s] Response: <%i %s>"
-        logger.debug(
-            log_msg,
-            *log_args,
-            extra={
-                "spider": spider,
-                "context_name": context_name,
-                "playwright_response_url": response.url,
-                "playwright_response_status": response.status,
-            },
-        )
 
-    return _log_response
+def _log_request(
+    request: PlaywrightRequest,
+    context_name: str,
+    spider: Optional[Spider],
+    structured_logging: bool = True,
+) -> None:
+    # Request.headers is available without a round trip to the browser
+    referrer = request.headers.get("referer")
+    extra = None
+    if structured_logging:
+        extra = {
+            "spider": spider,
+            "context_name": context_name,
+            "playwright_request_url": request.url,
+            "playwright_request_method": request.method,
+            "playwright_resource_type": request.resource_type,
+        }
+    # the browser already upper-cases standard methods, no need to do it here
+    logger.debug(
+        _REQUEST_LOG_MSG_REFERRER if referrer else _REQUEST_LOG_MSG,
+        context_name,
+        request.method,
+        request.url,
+        request.resource_type,
+        *((referrer,) if referrer else ()),
+        extra=extra,
+    )
+
+
+def _log_response(
+    response: PlaywrightResponse,
+    context_name: str,
+    spider: Optional[Spider],
+    structured_logging: bool = True,
+) -> None:
+    location = response.headers.get("location")
+    extra = None
+    if structured_logging:
+        extra = {
+            "spider": spider,
+            "context_name": context_name,
+            "playwright_response_url": response.url,
+            "playwright_response_status": response.status,
+        }
+    logger.debug(
+        _RESPONSE_LOG_MSG_LOCATION if location else _RESPONSE_LOG_MSG,
+        context_name,
+        response.status,
+        response.url,
+        *((location,) if location else ()),
+        extra=extra,
+    )
@@ -11,6 +11,9 @@ class PageMethod:
 
     If a callable is received, it will be called with the page as its first argument.
     Any additional arguments are passed to the callable after the page.
+
+    Set should_wait_for_load_state to False to skip waiting for the page load state
+    right after calling the method, the wait is then done after the next method.
     """
 
     def __init__(self, method: Union[str, Callable], *args, **kwargs) -> None:
@@ -18,6 +21,7 @@ class PageMethod:
         self.args: tuple = args
         self.kwargs: dict = kwargs
         self.result: Any = None
+        self.should_wait_for_load_state: bool = True
 
     def __str__(self) -> str:
         return f"<{self.__class__.__name__} for method '{self.method}'>"